@@ -1,23 +1,76 @@
 import csv
+from operator import itemgetter
+
+
+REPORT_COLUMNS = (
+    "id", "mode", "width", "height", "queue_time", "dequeue_time",
+    "generate_times", "vsync_times",
+)
+
+
+def parse_time_list(field):
+    return list(map(int, filter(None, field.split(":"))))
+
+
+def read_report_rows(in_file):
+    reader = csv.reader(in_file, delimiter=",")
+    header = next(reader)
+    size = len(header)
+
+    # Like csv.DictReader, skip blank lines and treat missing trailing
+    # fields as empty, so that every row has exactly one field per column
+    rows = [
+        row if len(row) == size else (row + [""] * size)[:size]
+        for row in reader if row
+    ]
+
+    return header, rows
+
+
+def parse_columns_csv(in_file):
+    header, rows = read_report_rows(in_file)
+
+    # Transpose the report so that each column is converted in a single pass
+    columns = dict(zip(header, zip(*rows))) or dict.fromkeys(header, ())
+
+    return {
+        "id": list(columns["id"]),
+        "mode": list(columns["mode"]),
+        "width": list(map(int, columns["width"])),
+        "height": list(map(int, columns["height"])),
+        "queue_time": list(map(int, columns["queue_time"])),
+        "dequeue_time": list(map(int, columns["dequeue_time"])),
+        "generate_times": list(map(parse_time_list, columns["generate_times"])),
+        "vsync_times": list(map(parse_time_list, columns["vsync_times"])),
+    }
 
 
 def parse_updates_csv(in_file):
-    reader = csv.DictReader(in_file, delimiter=",")
-    updates = list(reader)
-
-    for update in updates:
-        update["width"] = int(update["width"])
-        update["height"] = int(update["height"])
-        update["queue_time"] = int(update["queue_time"])
-        update["dequeue_time"] = int(update["dequeue_time"])
-        update["generate_times"] = \
-            list(map(int, update["generate_times"].split(":"))) \
-            if update["generate_times"] else []
-        update["vsync_times"] = \
-            list(map(int, update["vsync_times"].split(":"))) \
-            if update["vsync_times"] else []
-        update["start"] = update["queue_time"]
-        update["end"] = update["vsync_times"][-1] \
-            if update["vsync_times"] else update["generate_times"][-1]
+    header, rows = read_report_rows(in_file)
+    get_fields = itemgetter(*map(header.index, REPORT_COLUMNS))
+    updates = []
+
+    for row in rows:
+        (
+            update_id, mode, width, height, queue_time, dequeue_time,
+            generate_times, vsync_times,
+        ) = get_fields(row)
+
+        queue_time = int(queue_time)
+        generate_times = parse_time_list(generate_times)
+        vsync_times = parse_time_list(vsync_times)
+
+        updates.append({
+            "id": update_id,
+            "mode": mode,
+            "width": int(width),
+            "height": int(height),
+            "queue_time": queue_time,
+            "dequeue_time": int(dequeue_time),
+            "generate_times": generate_times,
+            "vsync_times": vsync_times,
+            "start": queue_time,
+            "end": vsync_times[-1] if vsync_times else generate_times[-1],
+        })
 
     return updates
@@ -13,6 +13,7 @@ on each row:
 """
 import sys
 import argparse
+from operator import itemgetter, sub
 from perf import parse_updates_csv
 
 
@@ -21,21 +22,11 @@ TIME_UNIT_WIDTH = 0.000_1
 TIME_TICK_SPACE = 1_000_000
 UPDATE_ROW_HEIGHT = 10
 UPDATE_LABEL_SPACING = 5
+OUTPUT_BUFFER_SIZE = 1 << 20
 
+PARITIES = ("even", "odd")
 
-def draw_updates(updates, out):
-    start_time = min(update["start"] for update in updates)
-    start_time -= TIME_MARGIN
-    end_time = max(update["end"] for update in updates)
-    end_time += TIME_MARGIN
-
-    delta_to_x = lambda t1, t2: TIME_UNIT_WIDTH * (t2 - t1)
-    time_to_x = lambda time: delta_to_x(start_time, time)
-
-    print(f"""<svg version="1.1" xmlns="http://www.w3.org/2000/svg" \
-width="{delta_to_x(start_time, end_time)}" \
-height="{len(updates) * UPDATE_ROW_HEIGHT}">
-<style type="text/css"><![CDATA[
+SVG_STYLESHEET = f"""<style type="text/css"><![CDATA[
     .stripe-even {{
         fill: #f0f0f0;
     }}
@@ -74,84 +65,104 @@ height="{len(updates) * UPDATE_ROW_HEIGHT}">
     .update-vsync-odd {{
         fill: #2222aa;
     }}
-]]></style>""", file=out)
+]]></style>
+"""
+
+STRIPE_RECT = f'<rect x="0" y="%s" width="%s" \
+height="{UPDATE_ROW_HEIGHT}" class="stripe-%s" />\n'
+TIME_TICK_LINE = '<line x1="%s" x2="%s" y1="0" y2="%s" class="time-tick" />\n'
+FRAME_RECT = f'<rect x="%s" y="%s" width="%s" height="{UPDATE_ROW_HEIGHT}" \
+class="update-%s-%s"><title>Update #%s — %s frame #%s — %s ms\
+</title></rect>\n'
+
+
+def draw_updates(updates, out):
+    start_time = min(map(itemgetter("start"), updates)) - TIME_MARGIN
+    end_time = max(map(itemgetter("end"), updates)) + TIME_MARGIN
+
+    scale = TIME_UNIT_WIDTH
+    delta_to_x = lambda t1, t2: scale * (t2 - t1)
+    time_to_x = lambda time: delta_to_x(start_time, time)
+    times_to_x = lambda times: [scale * (time - start_time) for time in times]
+    plot_width = delta_to_x(start_time, end_time)
+    write = out.write
+
+    write(f"""<svg version="1.1" xmlns="http://www.w3.org/2000/svg" \
+width="{plot_width}" \
+height="{len(updates) * UPDATE_ROW_HEIGHT}">
+""")
+    write(SVG_STYLESHEET)
 
     # Add alternating row stripes
     for y in range(len(updates)):
-        print(f"""<rect x="0" y="{y * UPDATE_ROW_HEIGHT}" \
-width="{delta_to_x(start_time, end_time)}" \
-height="{UPDATE_ROW_HEIGHT}" \
-class="stripe-{"even" if y % 2 == 0 else "odd"}" />""", file=out)
+        write(STRIPE_RECT % (
+            y * UPDATE_ROW_HEIGHT, plot_width, PARITIES[y % 2],
+        ))
 
     # Add time ticks
-    for time in range(start_time, end_time, TIME_TICK_SPACE):
-        print(f"""<line x1="{time_to_x(time)}" x2="{time_to_x(time)}" \
-y1="0" y2="{len(updates) * UPDATE_ROW_HEIGHT}" class="time-tick" />""", file=out)
+    out.writelines(
+        TIME_TICK_LINE % (x, x, len(updates) * UPDATE_ROW_HEIGHT)
+        for x in times_to_x(range(start_time, end_time, TIME_TICK_SPACE))
+    )
 
     # Add update rects
     for y, update in enumerate(updates):
+        update_id = update["id"]
+        row_y = y * UPDATE_ROW_HEIGHT
+
         # Update ID labels on both ends
-        print(f"""<text x="{time_to_x(update["start"]) -
+        write(f"""<text x="{time_to_x(update["start"]) -
 UPDATE_LABEL_SPACING}" y="{(y + 0.55) * UPDATE_ROW_HEIGHT}" \
 class="update-label">\
-#{update["id"]} \
+#{update_id} \
 (mode {update["mode"]})\
-</text>""", file=out)
-        print(f"""<text x="{time_to_x(update["end"]) +
+</text>
+""")
+        write(f"""<text x="{time_to_x(update["end"]) +
 UPDATE_LABEL_SPACING}" y="{(y + 0.55) * UPDATE_ROW_HEIGHT}" \
 class="update-label update-label-end">\
 {round((update["dequeue_time"] - update["start"]) / 1_000)} ms + \
-{round((update["end"] - update["dequeue_time"]) / 1_000)} ms</text>""", file=out)
+{round((update["end"] - update["dequeue_time"]) / 1_000)} ms</text>
+""")
 
         # Add rectangle for the preparation time
-        print(f"""<rect x="{time_to_x(update["dequeue_time"])}" \
-y="{y * UPDATE_ROW_HEIGHT}" \
+        write(f"""<rect x="{time_to_x(update["dequeue_time"])}" \
+y="{row_y}" \
 width="{delta_to_x(update["dequeue_time"], update["generate_times"][0])}" \
 height="{UPDATE_ROW_HEIGHT}" \
 class="update-prepare"><title>\
-Update #{update["id"]} — Prepare — \
+Update #{update_id} — Prepare — \
 {round((update["generate_times"][0] - update["dequeue_time"]) / 1_000)} ms\
-</title></rect>""", file=out)
-
-        # Add one rectangle per frame generation time
-        for x, (start, end) in enumerate(zip(
-            update["generate_times"][:-1],
-            update["generate_times"][1:]
-        )):
-            print(f"""<rect x="{time_to_x(start)}" \
-y="{y * UPDATE_ROW_HEIGHT}" \
-width="{delta_to_x(start, end)}" \
-height="{UPDATE_ROW_HEIGHT}" \
-class="update-generate-{"even" if x % 2 == 0 else "odd"}"><title>\
-Update #{update["id"]} — Generate frame #{x} — \
-{round((end - start) / 1_000)} ms\
-</title></rect>""", file=out)
-
-        # Add one rectangle per frame vsync time
-        for x, (start, end) in enumerate(zip(
-            update["vsync_times"][:-1],
-            update["vsync_times"][1:]
-        )):
-            print(f"""<rect x="{time_to_x(start)}" \
-y="{y * UPDATE_ROW_HEIGHT}" \
-width="{delta_to_x(start, end)}" \
-height="{UPDATE_ROW_HEIGHT}" \
-class="update-vsync-{"even" if x % 2 == 0 else "odd"}"><title>\
-Update #{update["id"]} — Vsync frame #{x} — \
-{round((end - start) / 1_000)} ms\
-</title></rect>""", file=out)
+</title></rect>
+""")
+
+        # Add one rectangle per frame generation and vsync time
+        for kind, label in (("generate", "Generate"), ("vsync", "Vsync")):
+            times = update[f"{kind}_times"]
+            durations = list(map(sub, times[1:], times))
+
+            for x, (left, width, duration) in enumerate(zip(
+                times_to_x(times),
+                [scale * duration for duration in durations],
+                durations,
+            )):
+                write(FRAME_RECT % (
+                    left, row_y, width, kind, PARITIES[x % 2],
+                    update_id, label, x, round(duration / 1_000),
+                ))
 
         # Add diamond for time where the update was queued
-        print(f"""<rect \
+        write(f"""<rect \
 x="{time_to_x(update["queue_time"]) - 0.15 * UPDATE_ROW_HEIGHT}" \
 y="{(y + 0.35) * UPDATE_ROW_HEIGHT}" width="{0.3 * UPDATE_ROW_HEIGHT}" \
 height="{0.3 * UPDATE_ROW_HEIGHT}" class="update-queue" \
 transform="rotate(45 {time_to_x(update["queue_time"])} \
 {(y + 0.5) * UPDATE_ROW_HEIGHT})"><title>\
-Update #{update["id"]} — Queue time\
-</title></rect>""", file=out)
+Update #{update_id} — Queue time\
+</title></rect>
+""")
 
-    print("</svg>", file=out)
+    write("</svg>\n")
 
 
 def main():
@@ -173,7 +184,8 @@ output)"
     args = parser.parse_args()
 
     in_file = open(args.input, "r") if args.input is not None else sys.stdin
-    out_file = open(args.output, "w") if args.output is not None else sys.stdout
+    out_file = open(args.output, "w", buffering=OUTPUT_BUFFER_SIZE) \
+        if args.output is not None else sys.stdout
 
     updates = parse_updates_csv(in_file)
     draw_updates(updates, out_file)
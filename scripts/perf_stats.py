@@ -17,9 +17,11 @@ average and standard deviation for the following measurements:
 import argparse
 import math
 import sys
-from statistics import mean, stdev
-from itertools import groupby, pairwise
-from perf import parse_updates_csv
+from collections import defaultdict
+from operator import mul, sub, truediv
+from itertools import repeat
+from statistics import StatisticsError
+from perf import parse_columns_csv
 
 def round_signif_digits(number, digits):
     if number == 0:
@@ -29,45 +31,66 @@ def round_signif_digits(number, digits):
         return round(number, digits - 1 - magnitude)
 
 def series_stats(series):
+    # Welford's algorithm, computing both statistics in a single pass
+    count = 0
+    mean = 0.0
+    sum_squares = 0.0
+
+    for value in series:
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        sum_squares += delta * (value - mean)
+
+    if count < 2:
+        raise StatisticsError("stdev requires at least two data points")
+
     return {
-        "mean": mean(series),
-        "stdev": stdev(series),
+        "mean": mean,
+        "stdev": math.sqrt(sum_squares / (count - 1)),
     }
 
 def series_quotient_stats(series, quotients):
-    return {
-        "mean": mean(item / quo for item, quo in zip(series, quotients)),
-        "stdev": mean(item / quo for item, quo in zip(series, quotients)),
-    }
+    return series_stats(map(truediv, series, quotients))
 
 
-def generate_stats(updates):
-    key = lambda update: update["mode"]
+def generate_stats(columns):
+    queue_times = columns["queue_time"]
+    dequeue_times = columns["dequeue_time"]
+    generate_times = columns["generate_times"]
+    vsync_times = columns["vsync_times"]
+    areas = list(map(mul, columns["width"], columns["height"]))
+
+    groups = defaultdict(list)
     results = {}
 
-    for mode, group in groupby(sorted(updates, key=key), key):
-        latency = []
+    for index, mode in enumerate(columns["mode"]):
+        groups[mode].append(index)
+
+    for mode, indices in sorted(groups.items()):
+        latency = [dequeue_times[i] - queue_times[i] for i in indices]
         generation = []
+        generation_areas = []
         vsync = []
-        areas = []
-
-        for update in group:
-            latency.append(update["dequeue_time"] - update["queue_time"])
+        vsync_areas = []
 
-            for start, end in pairwise(update["generate_times"]):
-                generation.append(end - start)
+        for i in indices:
+            times = generate_times[i]
+            generation.extend(map(sub, times[1:], times))
+            generation_areas.extend(repeat(areas[i], len(times) - 1))
 
-            for start, end in pairwise(update["vsync_times"]):
-                vsync.append(end - start)
-
-            areas.append(update["width"] * update["height"])
+            times = vsync_times[i]
+            vsync.extend(map(sub, times[1:], times))
+            vsync_areas.extend(repeat(areas[i], len(times) - 1))
 
         results[mode] = {
             "latency": series_stats(latency),
             "generation": series_stats(generation),
-            "generation_per_area": series_quotient_stats(generation, areas),
+            "generation_per_area": series_quotient_stats(
+                generation, generation_areas
+            ),
             "vsync": series_stats(vsync),
-            "vsync_per_area": series_quotient_stats(vsync, areas),
+            "vsync_per_area": series_quotient_stats(vsync, vsync_areas),
         }
 
     return results
@@ -93,23 +116,23 @@ standard output)"
     in_file = open(args.input, "r") if args.input is not None else sys.stdin
     out_file = open(args.output, "w") if args.output is not None else sys.stdout
 
-    updates = parse_updates_csv(in_file)
-    stats = generate_stats(updates)
+    columns = parse_columns_csv(in_file)
+    stats = generate_stats(columns)
 
-    print("mode,", end="", file=out_file)
-    print(",".join(
+    lines = ["mode," + ",".join(
         f"{kind}_{stat}"
         for kind, values in stats["0"].items()
         for stat in values.keys()
-    ), file=out_file)
+    )]
 
     for mode, data in stats.items():
-        print(f"{mode},", end="", file=out_file)
-        print(",".join(
+        lines.append(f"{mode}," + ",".join(
             str(round_signif_digits(value, 6))
             for values in data.values()
             for value in values.values()
-        ), file=out_file)
+        ))
+
+    out_file.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
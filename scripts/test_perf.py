@@ -0,0 +1,87 @@
+import io
+import math
+import unittest
+from statistics import StatisticsError
+from perf import parse_columns_csv, parse_updates_csv
+from perf_stats import generate_stats, series_stats
+
+
+REPORT = """\
+id,mode,width,height,queue_time,dequeue_time,generate_times,vsync_times
+1,0,10,20,100,150,200:300:400,410:500:600
+2,1,30,40,700,750,800:900,910:1000
+"""
+
+
+class TestParseReport(unittest.TestCase):
+    def test_blank_lines(self):
+        report = REPORT.replace("\n2,", "\n\n2,") + "\n"
+        self.assertEqual(
+            parse_updates_csv(io.StringIO(report)),
+            parse_updates_csv(io.StringIO(REPORT)),
+        )
+        self.assertEqual(
+            parse_columns_csv(io.StringIO(report)),
+            parse_columns_csv(io.StringIO(REPORT)),
+        )
+
+    def test_truncated_row(self):
+        report = REPORT + "3,0,1,1,5,6,7:8\n"
+        updates = parse_updates_csv(io.StringIO(report))
+        self.assertEqual(len(updates), 3)
+        self.assertEqual(updates[2]["generate_times"], [7, 8])
+        self.assertEqual(updates[2]["vsync_times"], [])
+        self.assertEqual(updates[2]["end"], 8)
+
+        columns = parse_columns_csv(io.StringIO(report))
+        self.assertEqual(columns["id"], ["1", "2", "3"])
+        self.assertEqual(columns["vsync_times"][2], [])
+
+
+STATS_REPORT = """\
+id,mode,width,height,queue_time,dequeue_time,generate_times,vsync_times
+1,0,10,10,0,50,100:200:400,400:500:700
+2,0,10,20,500,800,1000:1400,1400:1800:2400
+"""
+
+
+class TestStats(unittest.TestCase):
+    def test_series_stats(self):
+        stats = series_stats([100, 200, 400])
+        self.assertAlmostEqual(stats["mean"], 700 / 3)
+        self.assertAlmostEqual(stats["stdev"], math.sqrt(70_000 / 3))
+
+    def test_series_stats_too_short(self):
+        with self.assertRaises(StatisticsError):
+            series_stats([5])
+
+        with self.assertRaises(StatisticsError):
+            series_stats([])
+
+    def test_generate_stats(self):
+        stats = generate_stats(parse_columns_csv(io.StringIO(STATS_REPORT)))
+        self.assertEqual(list(stats.keys()), ["0"])
+        stats = stats["0"]
+
+        self.assertAlmostEqual(stats["latency"]["mean"], 175)
+        self.assertAlmostEqual(stats["latency"]["stdev"], math.sqrt(31_250))
+
+        # Frame durations 100, 200 over an area of 100, and 400 over 200
+        self.assertAlmostEqual(stats["generation"]["mean"], 700 / 3)
+        self.assertAlmostEqual(
+            stats["generation_per_area"]["mean"], 5 / 3
+        )
+        self.assertAlmostEqual(
+            stats["generation_per_area"]["stdev"], math.sqrt(1 / 3)
+        )
+
+        # Frame durations 100, 200 over an area of 100, and 400, 600 over 200
+        self.assertAlmostEqual(stats["vsync"]["mean"], 325)
+        self.assertAlmostEqual(stats["vsync_per_area"]["mean"], 2)
+        self.assertAlmostEqual(
+            stats["vsync_per_area"]["stdev"], math.sqrt(2 / 3)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()